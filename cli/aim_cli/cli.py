@@ -7,98 +7,318 @@ Copyright (c) 2026 Juice d.o.o (https://juice.com.hr)
 Licensed under MIT License
 """
 
-import argparse
-import json
+import http.client
+import mmap
+import os
 import re
 import sys
-import urllib.request
+import threading
 import urllib.error
+import urllib.parse
+import urllib.request
+from email.message import Message
 from pathlib import Path
-from typing import Optional, Dict, List
+from types import SimpleNamespace
+from typing import Optional, Dict, List, Tuple
 
-from aim_cli import __version__
+from aim_cli import __version__, _jsonio
 from aim_cli.config import (
     load_config, save_config, init_config, get_config_path,
     get_config_value, set_config_value
 )
-from aim_cli.prompt_builder import (
-    build_synthesis_prompt, interactive_prompt_builder,
-    copy_to_clipboard, parse_stack_string
-)
 
 # Configuration
-REGISTRY_URL = "https://intentmodel.dev/registry-files/index.json"
+REGISTRY_BASE_URL = "https://intentmodel.dev"
+REGISTRY_URL = f"{REGISTRY_BASE_URL}/registry-files/index.json"
 AIM_DIR = Path("aim")
 LOCK_FILE = Path("aim.lock")
+HTTP_TIMEOUT = 10
+MAX_REDIRECTS = 5
+MAX_DOWNLOAD_WORKERS = 8
+
+# Kept-alive connections keyed by (scheme, host). http.client connections
+# are not thread-safe, so each thread keeps its own set.
+_local = threading.local()
+
+
+# Pipes and redirected output get plain text without escape codes
+_USE_COLOR = sys.stdout.isatty()
 
 
 class Colors:
-    """ANSI color codes for terminal output"""
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+    """ANSI color codes for terminal output (empty when stdout is not a terminal)"""
+    CYAN = '\033[96m' if _USE_COLOR else ''
+    GREEN = '\033[92m' if _USE_COLOR else ''
+    YELLOW = '\033[93m' if _USE_COLOR else ''
+    RED = '\033[91m' if _USE_COLOR else ''
+    BOLD = '\033[1m' if _USE_COLOR else ''
+    END = '\033[0m' if _USE_COLOR else ''
+
+
+# Message prefixes, built once instead of on every call
+_PFX_OK = f"{Colors.GREEN}✓{Colors.END} "
+_PFX_ERR = f"{Colors.RED}✗{Colors.END} "
+_PFX_INFO = f"{Colors.CYAN}→{Colors.END} "
+_PFX_WARN = f"{Colors.YELLOW}⚠{Colors.END} "
 
 
 def print_success(msg: str):
-    print(f"{Colors.GREEN}✓{Colors.END} {msg}")
+    print(_PFX_OK + msg)
 
 
 def print_error(msg: str):
-    print(f"{Colors.RED}✗{Colors.END} {msg}", file=sys.stderr)
+    print(_PFX_ERR + msg, file=sys.stderr)
 
 
 def print_info(msg: str):
-    print(f"{Colors.CYAN}→{Colors.END} {msg}")
+    print(_PFX_INFO + msg)
 
 
 def print_warning(msg: str):
-    print(f"{Colors.YELLOW}⚠{Colors.END} {msg}")
+    print(_PFX_WARN + msg)
+
+
+def _get_connection(scheme: str, netloc: str) -> http.client.HTTPConnection:
+    """Return this thread's kept-alive connection for a host, opening it on first use"""
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get((scheme, netloc))
+    if conn is None:
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(netloc, timeout=HTTP_TIMEOUT)
+        else:
+            conn = http.client.HTTPConnection(netloc, timeout=HTTP_TIMEOUT)
+        connections[(scheme, netloc)] = conn
+    return conn
+
+
+def _send_get(scheme: str, netloc: str, path: str,
+              headers: Dict[str, str]) -> Tuple[http.client.HTTPResponse, bytes]:
+    """Send a GET over the host's connection and read the whole response"""
+    conn = None
+    try:
+        # Inside the try: a bad host or port (e.g. from a Location header) raises InvalidURL
+        conn = _get_connection(scheme, netloc)
+        try:
+            conn.request('GET', path, headers=headers)
+            response = conn.getresponse()
+        except (ConnectionResetError, BrokenPipeError):
+            # The server closed the idle keep-alive connection; reconnect once
+            conn.close()
+            conn.request('GET', path, headers=headers)
+            response = conn.getresponse()
+        return response, response.read()
+    except (OSError, http.client.HTTPException) as e:
+        if conn is not None:
+            conn.close()
+        raise urllib.error.URLError(e)
+
+
+def _uses_proxy(parts: urllib.parse.SplitResult) -> bool:
+    """Check whether the environment routes this URL through a proxy"""
+    return (parts.scheme in urllib.request.getproxies()
+            and not urllib.request.proxy_bypass(parts.hostname or ''))
+
+
+def _decode_body(headers: Message, body: bytes) -> bytes:
+    """Undo gzip Content-Encoding on a response body"""
+    if headers.get('Content-Encoding', '').lower() != 'gzip':
+        return body
+    import gzip
+    import zlib
+    try:
+        return gzip.decompress(body)
+    except (OSError, EOFError, zlib.error) as e:
+        raise urllib.error.URLError(f"invalid gzip response: {e}")
+
+
+def http_request(url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Message, bytes]:
+    """GET a URL and return (status, headers, body), reusing one connection per host
+
+    Bodies are requested gzip-compressed and returned decompressed.
+    Non-2xx responses raise HTTPError, except 304 Not Modified, which is returned.
+    """
+    headers = {'Accept-Encoding': 'gzip', **(headers or {})}
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ('http', 'https') or _uses_proxy(parts):
+            # urllib handles proxies and other schemes on its own
+            request = urllib.request.Request(url, headers=headers)
+            try:
+                with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
+                    body = _decode_body(response.headers, response.read())
+                    return response.getcode(), response.headers, body
+            except urllib.error.HTTPError as e:
+                if e.code == 304:
+                    return 304, e.headers, b''
+                raise
+
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        response, body = _send_get(parts.scheme, parts.netloc, path, headers)
+
+        location = response.getheader('Location')
+        if response.status in (301, 302, 303, 307, 308) and location:
+            url = urllib.parse.urljoin(url, location)
+            continue
+        if response.status != 304 and not 200 <= response.status < 300:
+            # Like urlopen: unfollowed redirects (no Location, 300, 305) are errors too
+            raise urllib.error.HTTPError(url, response.status, response.reason,
+                                         response.headers, None)
+        return response.status, response.headers, _decode_body(response.headers, body)
+
+    raise urllib.error.URLError(f"too many redirects for {url}")
+
+
+def http_get(url: str) -> bytes:
+    """GET a URL and return the body, reusing one connection per host"""
+    return http_request(url)[2]
+
+
+def get_cache_dir() -> Path:
+    """Directory for the registry cache ($XDG_CACHE_HOME/aim or ~/.cache/aim)
+
+    Raises RuntimeError when no home directory can be determined.
+    """
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'aim'
+
+
+def _read_registry_cache() -> Tuple[Optional[bytes], Dict[str, str]]:
+    """Return the cached registry bytes and their validators (ETag, Last-Modified)"""
+    try:
+        cache_dir = get_cache_dir()
+        meta = _jsonio.loads((cache_dir / 'registry.meta.json').read_bytes())
+        if not isinstance(meta, dict) or meta.get('url') != REGISTRY_URL:
+            return None, {}
+        return (cache_dir / 'registry.json').read_bytes(), meta
+    except (OSError, RuntimeError, ValueError):
+        return None, {}
+
+
+def _write_registry_cache(data: bytes, headers: Message) -> None:
+    """Cache the registry bytes with the validators needed for a conditional GET"""
+    meta = {
+        'url': REGISTRY_URL,
+        'etag': headers.get('ETag'),
+        'last_modified': headers.get('Last-Modified'),
+    }
+    if not meta['etag'] and not meta['last_modified']:
+        return  # Nothing to revalidate against
 
+    try:
+        cache_dir = get_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Data first: a stale validator only costs a full download next time
+        _jsonio.write_atomic(cache_dir / 'registry.json', data)
+        _jsonio.write_atomic(cache_dir / 'registry.meta.json', _jsonio.dumps(meta))
+    except (OSError, RuntimeError):
+        pass  # The cache is an optimisation; never fail a fetch over it
 
-def fetch_registry() -> Dict:
-    """Fetch the registry index from the remote server"""
+
+def _clear_registry_cache() -> None:
+    """Remove the cached registry and its validators"""
+    try:
+        cache_dir = get_cache_dir()
+        for name in ('registry.meta.json', 'registry.json'):
+            try:
+                (cache_dir / name).unlink()
+            except FileNotFoundError:
+                pass
+    except (OSError, RuntimeError):
+        pass
+
+
+def index_packages(registry: Dict) -> Dict[str, Dict]:
+    """Map package names to their registry entries (first entry wins)"""
+    index = {}
+    for pkg in registry.get('packages', []):
+        index.setdefault(pkg.get('name'), pkg)
+    return index
+
+
+def fetch_registry() -> Tuple[Dict, Dict[str, Dict]]:
+    """Fetch the registry index from the remote server
+
+    Returns the registry together with its name index (see index_packages).
+    The last response is cached under get_cache_dir() and revalidated with a
+    conditional GET, so an unchanged registry is not downloaded again.
+    """
     try:
         print_info(f"Fetching registry from {REGISTRY_URL}")
-        with urllib.request.urlopen(REGISTRY_URL, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            print_success("Registry fetched successfully")
-            return data
+        cached, meta = _read_registry_cache()
+        headers = {}
+        if cached is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        status, response_headers, raw = http_request(REGISTRY_URL, headers)
+        if status == 304 and cached is not None:
+            try:
+                registry = _jsonio.loads(cached)
+            except ValueError:
+                # The cached copy is corrupt; drop it and download afresh
+                _clear_registry_cache()
+                status, response_headers, raw = http_request(REGISTRY_URL)
+            else:
+                print_success("Registry unchanged, using cached copy")
+                return registry, index_packages(registry)
+
+        # Only a body that parses is worth caching
+        registry = _jsonio.loads(raw)
+        _write_registry_cache(raw, response_headers)
+        print_success("Registry fetched successfully")
+        return registry, index_packages(registry)
     except urllib.error.URLError as e:
         print_error(f"Failed to fetch registry: {e}")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:  # JSONDecodeError, or UnicodeDecodeError on bad bytes
         print_error(f"Failed to parse registry JSON: {e}")
         sys.exit(1)
 
 
-def find_package(registry: Dict, package_name: str) -> Optional[Dict]:
-    """Find a package in the registry by name"""
-    packages = registry.get('packages', [])
-    for pkg in packages:
-        if pkg.get('name') == package_name:
-            return pkg
-    return None
+def find_package(index: Dict[str, Dict], package_name: str) -> Optional[Dict]:
+    """Find a package by name in an index built by index_packages()"""
+    return index.get(package_name)
 
 
-def fetch_file(url: str) -> str:
-    """Fetch a file from a URL and return its content"""
+def fetch_file(url: str) -> bytes:
+    """Fetch a file from a URL and return its raw content"""
     try:
-        with urllib.request.urlopen(url, timeout=10) as response:
-            return response.read().decode('utf-8')
+        return http_get(url)
     except urllib.error.URLError as e:
         raise Exception(f"Failed to fetch {url}: {e}")
 
 
 def resolve_package_urls(entry_path: str) -> List[str]:
     """Convert registry entry path to full URLs"""
-    base_url = "https://intentmodel.dev"
     # entry_path is like "registry/packages/weather/weather.intent"
     # Convert to "registry-files/packages/weather/weather.intent"
     url_path = entry_path.replace("registry/", "registry-files/", 1)
-    return [f"{base_url}/{url_path}"]
+    return [f"{REGISTRY_BASE_URL}/{url_path}"]
+
+
+def list_intents(directory: Path = AIM_DIR) -> List[Path]:
+    """List the .intent files in a directory with a single scandir pass"""
+    try:
+        with os.scandir(directory) as entries:
+            return [Path(e.path) for e in entries
+                    if e.name.endswith('.intent') and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def read_header(path: Path) -> str:
+    """Read the first line of a file without loading the rest of it"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''  # Empty files cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = mm.find(b'\n')
+            return mm[:end if end >= 0 else len(mm)].decode('utf-8')
 
 
 def cmd_init(args):
@@ -112,7 +332,7 @@ def cmd_init(args):
     print_info("Use 'aim fetch <package>' to install packages")
 
 
-def cmd_fetch(args):
+def cmd_fetch(args, index: Optional[Dict[str, Dict]] = None):
     """Fetch a package from the registry"""
     package_name = args.package
 
@@ -121,15 +341,15 @@ def cmd_fetch(args):
         print_info("Creating aim/ directory")
         AIM_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Fetch registry
-    registry = fetch_registry()
+    # Fetch registry, unless the caller passed its index (see index_packages)
+    if index is None:
+        _registry, index = fetch_registry()
 
     # Find package
-    pkg = find_package(registry, package_name)
+    pkg = find_package(index, package_name)
     if not pkg:
         print_error(f"Package '{package_name}' not found in registry")
-        available = [p.get('name') for p in registry.get('packages', [])]
-        print_info(f"Available packages: {', '.join(available)}")
+        print_info(f"Available packages: {', '.join(index)}")
         sys.exit(1)
 
     print_info(f"Found package: {pkg['name']} v{pkg['version']}")
@@ -137,23 +357,30 @@ def cmd_fetch(args):
     # Get package URLs
     urls = resolve_package_urls(pkg['entry'])
 
-    # Fetch and save files
-    for url in urls:
-        try:
+    # Fetch files (concurrently when there are several) and save them
+    try:
+        for url in urls:
             print_info(f"Fetching {url}")
-            content = fetch_file(url)
+        if len(urls) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(urls))) as executor:
+                contents = list(executor.map(fetch_file, urls))
+        else:
+            # A single file reuses the connection the registry came over
+            contents = [fetch_file(url) for url in urls]
 
+        for url, content in zip(urls, contents):
             # Extract filename from URL
             filename = url.split('/')[-1]
             dest_path = AIM_DIR / filename
 
             # Write file
-            dest_path.write_text(content, encoding='utf-8')
+            dest_path.write_bytes(content)
             print_success(f"Saved {dest_path}")
 
-        except Exception as e:
-            print_error(str(e))
-            sys.exit(1)
+    except Exception as e:
+        print_error(str(e))
+        sys.exit(1)
 
     # Update lock file
     update_lock_file(pkg)
@@ -167,39 +394,43 @@ def cmd_list(args):
         print_warning("No aim/ directory found. Run 'aim init' first.")
         return
 
-    intent_files = list(AIM_DIR.glob("*.intent"))
+    intent_files = list_intents()
 
     if not intent_files:
         print_info("No packages installed")
         return
 
-    print(f"\n{Colors.BOLD}Installed packages:{Colors.END}")
+    # Collect the whole listing and write it in one call
+    bullet = f"  {Colors.CYAN}•{Colors.END} "
+    out = [f"\n{Colors.BOLD}Installed packages:{Colors.END}\n"]
     for intent_file in sorted(intent_files):
         # Try to extract package info from header
         try:
-            content = intent_file.read_text(encoding='utf-8')
-            first_line = content.split('\n')[0].strip()
+            first_line = read_header(intent_file).strip()
             if first_line.startswith('AIM:'):
                 header = first_line.replace('AIM:', '').strip()
-                print(f"  {Colors.CYAN}•{Colors.END} {intent_file.name} ({header})")
+                out.append(f"{bullet}{intent_file.name} ({header})\n")
             else:
-                print(f"  {Colors.CYAN}•{Colors.END} {intent_file.name}")
+                out.append(f"{bullet}{intent_file.name}\n")
         except Exception:
-            print(f"  {Colors.CYAN}•{Colors.END} {intent_file.name}")
+            out.append(f"{bullet}{intent_file.name}\n")
 
-    print()
+    out.append("\n")
 
     # Show lock file if exists
     if LOCK_FILE.exists():
         try:
-            lock_data = json.loads(LOCK_FILE.read_text())
-            print(f"{Colors.BOLD}Lock file:{Colors.END}")
+            lock_data = _jsonio.loads(LOCK_FILE.read_bytes())
+            lock_lines = [f"{Colors.BOLD}Lock file:{Colors.END}\n"]
             for pkg_name, pkg_info in lock_data.items():
-                print(f"  {Colors.CYAN}•{Colors.END} {pkg_name} v{pkg_info.get('version')}")
-            print()
+                lock_lines.append(f"{bullet}{pkg_name} v{pkg_info.get('version')}\n")
+            lock_lines.append("\n")
+            out.extend(lock_lines)
         except Exception:
             pass
 
+    sys.stdout.write(''.join(out))
+
 
 def cmd_validate(args):
     """Validate local intent files against AIM v1.5 specification"""
@@ -207,21 +438,26 @@ def cmd_validate(args):
         print_warning("No aim/ directory found")
         return
 
-    intent_files = list(AIM_DIR.glob("*.intent"))
+    intent_files = list_intents()
 
     # Also check in mappings subdirectory
-    mappings_dir = AIM_DIR / "mappings"
-    if mappings_dir.exists():
-        intent_files.extend(mappings_dir.glob("*.intent"))
+    intent_files.extend(list_intents(AIM_DIR / "mappings"))
 
     if not intent_files:
         print_warning("No .intent files found")
         return
 
-    print_info("Validating intent files against AIM v1.5...")
+    # Buffer stdout lines and write them in one call; errors go to stderr,
+    # so pending lines are flushed first to keep the report in order
+    out = [_PFX_INFO + "Validating intent files against AIM v1.5...\n"]
     valid_count = 0
     invalid_count = 0
 
+    def report_error(msg: str) -> None:
+        sys.stdout.write(''.join(out))
+        out.clear()
+        print_error(msg)
+
     # AIM v1.5 header regex from specification
     aim_header_pattern = re.compile(
         r'^AIM:\s+([a-z0-9]+(?:\.[a-z0-9]+)*)#(intent|schema|flow|contract|persona|view|event|mapping)@([0-9]+\.[0-9]+)$'
@@ -229,37 +465,37 @@ def cmd_validate(args):
 
     for intent_file in intent_files:
         try:
-            content = intent_file.read_text(encoding='utf-8')
-            lines = content.split('\n')
+            # Decode the whole file so encoding errors anywhere are reported
+            content = intent_file.read_bytes().decode('utf-8')
+            header = content.partition('\n')[0].strip()
 
             # Check for AIM header
-            if not lines or not lines[0].strip().startswith('AIM:'):
-                print_error(f"{intent_file.name}: Missing AIM header")
+            if not header.startswith('AIM:'):
+                report_error(f"{intent_file.name}: Missing AIM header")
                 invalid_count += 1
                 continue
 
             # Validate against AIM v1.5 header format
-            header = lines[0].strip()
             match = aim_header_pattern.match(header)
 
             if not match:
-                print_error(f"{intent_file.name}: Invalid AIM v1.5 header format")
-                print_warning(f"  Header: {header}")
-                print_info(f"  Expected: AIM: <feature>#<facet>@<x.y>")
-                print_info(f"  Valid facets: intent, schema, flow, contract, persona, view, event, mapping")
+                report_error(f"{intent_file.name}: Invalid AIM v1.5 header format")
+                out.append(f"{_PFX_WARN}  Header: {header}\n")
+                out.append(f"{_PFX_INFO}  Expected: AIM: <feature>#<facet>@<x.y>\n")
+                out.append(f"{_PFX_INFO}  Valid facets: intent, schema, flow, contract, persona, view, event, mapping\n")
                 invalid_count += 1
                 continue
 
             feature, facet, version = match.groups()
-            print_success(f"{intent_file.name}: Valid (AIM: {feature}#{facet}@{version})")
+            out.append(f"{_PFX_OK}{intent_file.name}: Valid (AIM: {feature}#{facet}@{version})\n")
             valid_count += 1
 
         except Exception as e:
-            print_error(f"{intent_file.name}: {e}")
+            report_error(f"{intent_file.name}: {e}")
             invalid_count += 1
 
-    print()
-    print_info(f"Validation complete: {valid_count} valid, {invalid_count} invalid")
+    out.append(f"\n{_PFX_INFO}Validation complete: {valid_count} valid, {invalid_count} invalid\n")
+    sys.stdout.write(''.join(out))
 
     if invalid_count > 0:
         sys.exit(1)
@@ -272,7 +508,7 @@ def update_lock_file(pkg: Dict):
     # Read existing lock file
     if LOCK_FILE.exists():
         try:
-            lock_data = json.loads(LOCK_FILE.read_text())
+            lock_data = _jsonio.loads(LOCK_FILE.read_bytes())
         except Exception:
             pass
 
@@ -283,18 +519,19 @@ def update_lock_file(pkg: Dict):
     }
 
     # Write lock file
-    LOCK_FILE.write_text(json.dumps(lock_data, indent=2), encoding='utf-8')
+    _jsonio.write_atomic(LOCK_FILE, _jsonio.dumps(lock_data, indent=True))
 
 
-def cmd_info(args):
+def cmd_info(args, index: Optional[Dict[str, Dict]] = None):
     """Show information about a package"""
     package_name = args.package
 
-    # Fetch registry
-    registry = fetch_registry()
+    # Fetch registry, unless the caller passed its index (see index_packages)
+    if index is None:
+        _registry, index = fetch_registry()
 
     # Find package
-    pkg = find_package(registry, package_name)
+    pkg = find_package(index, package_name)
     if not pkg:
         print_error(f"Package '{package_name}' not found in registry")
         sys.exit(1)
@@ -359,12 +596,17 @@ def cmd_config_list(args):
         print(f"\n{Colors.BOLD}Config:{Colors.END} (using defaults)")
 
     print()
-    print(json.dumps(config, indent=2))
+    print(_jsonio.dumps(config, indent=True).decode('utf-8'))
     print()
 
 
 def cmd_synth(args):
     """Generate synthesis prompts for packages"""
+    # Only synth needs the prompt builder; keep it off other commands' startup
+    from aim_cli.prompt_builder import (
+        build_synthesis_prompt, interactive_prompt_builder,
+        copy_to_clipboard, parse_stack_string
+    )
 
     # Handle --list flag
     if args.list:
@@ -381,6 +623,9 @@ def cmd_synth(args):
     # Load config
     config = load_config()
 
+    # Scan aim/ once; package lookups below filter this list in memory
+    all_intent_files = list_intents()
+
     # Handle interactive mode
     if args.interactive:
         # Get available packages
@@ -388,7 +633,7 @@ def cmd_synth(args):
             print_error("No aim/ directory found. Run 'aim init' first.")
             sys.exit(1)
 
-        intent_files = list(AIM_DIR.glob("*.intent"))
+        intent_files = all_intent_files
         if not intent_files:
             print_error("No packages installed. Run 'aim fetch <package>' first.")
             sys.exit(1)
@@ -405,8 +650,7 @@ def cmd_synth(args):
         package_name = args.package
 
         # Check if package exists
-        intent_files = list(AIM_DIR.glob(f"*{package_name}*.intent"))
-        if not intent_files:
+        if not any(package_name in f.stem for f in all_intent_files):
             print_error(f"Package '{package_name}' not found in aim/")
             print_info("Run 'aim list' to see installed packages")
             print_info("Run 'aim fetch <package>' to install a package")
@@ -425,7 +669,7 @@ def cmd_synth(args):
         }
 
     # Find intent files for the package
-    intent_files = list(AIM_DIR.glob(f"*{prompt_data['package']}*.intent"))
+    intent_files = [f for f in all_intent_files if prompt_data['package'] in f.stem]
 
     # Build prompt
     prompt = build_synthesis_prompt(
@@ -448,13 +692,28 @@ def cmd_synth(args):
             print_success("✓ Copied to clipboard!")
         else:
             print_warning("Could not copy to clipboard - please copy manually")
-            print_info("(Install pbcopy/xclip/clip for automatic clipboard support)")
+            print_info("(Install pbcopy/xclip/xsel/wl-copy/clip for automatic clipboard support)")
     else:
         print_info("Prompt displayed (not copied to clipboard)")
     print()
 
 
+# Commands without arguments, dispatched without building the argparse tree
+FAST_COMMANDS = {
+    'init': cmd_init,
+    'list': cmd_list,
+    'validate': cmd_validate,
+}
+
+
 def main():
+    # Fast path for the common parameterless commands
+    if len(sys.argv) == 2 and sys.argv[1] in FAST_COMMANDS:
+        FAST_COMMANDS[sys.argv[1]](SimpleNamespace(command=sys.argv[1]))
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog='sinth',
         description='Sinth — the CLI for AIM. Synthesize intent into reality.',
@@ -7,9 +7,12 @@ Copyright (c) 2026 Juice d.o.o (https://juice.com.hr)
 Licensed under MIT License
 """
 
-import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+from aim_cli import _jsonio
 
 
 DEFAULT_CONFIG = {
@@ -23,43 +26,54 @@ DEFAULT_CONFIG = {
     "outputDir": "aim"
 }
 
+# (config file mtime in ns or None if missing, merged config) from the last load_config_cached()
+_config_cache: Optional[Tuple[Optional[int], Dict[str, Any]]] = None
+
 
+@lru_cache(maxsize=1)
 def get_config_path() -> Path:
-    """Get path to config file (./aim.config.json)"""
+    """Get path to config file (./aim.config.json), resolved once per process"""
     return Path.cwd() / "aim.config.json"
 
 
 def load_config() -> Dict[str, Any]:
     """Load config from aim.config.json or return defaults"""
-    config_path = get_config_path()
-
-    if not config_path.exists():
-        return DEFAULT_CONFIG.copy()
-
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-
-        # Merge with defaults to ensure all keys exist
-        merged = DEFAULT_CONFIG.copy()
-        merged.update(config)
+        config = _jsonio.loads(get_config_path().read_bytes())
+    except (_jsonio.JSONDecodeError, IOError):
+        # Return defaults if config is missing (FileNotFoundError) or invalid
+        config = {}
+
+    # Merge with defaults in one pass; stack is deep-merged and never shares
+    # the DEFAULT_CONFIG dict, so callers may mutate the result freely
+    return {
+        **DEFAULT_CONFIG,
+        **config,
+        'stack': {**DEFAULT_CONFIG['stack'], **config.get('stack', {})},
+    }
+
+
+def load_config_cached() -> Dict[str, Any]:
+    """Like load_config(), but reuse the last result while the file's mtime is unchanged"""
+    global _config_cache
+    try:
+        mtime = os.stat(get_config_path()).st_mtime_ns
+    except OSError:
+        mtime = None
 
-        # Deep merge stack if it exists
-        if 'stack' in config:
-            merged['stack'] = {**DEFAULT_CONFIG['stack'], **config['stack']}
+    if _config_cache is None or _config_cache[0] != mtime:
+        _config_cache = (mtime, load_config())
 
-        return merged
-    except (json.JSONDecodeError, IOError) as e:
-        # Return defaults if config is invalid
-        return DEFAULT_CONFIG.copy()
+    # Hand out a copy so callers can't mutate the cached entry
+    config = _config_cache[1]
+    return {**config, 'stack': dict(config['stack'])}
 
 
 def save_config(config: Dict[str, Any]) -> None:
     """Save config to aim.config.json"""
-    config_path = get_config_path()
-
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2)
+    global _config_cache
+    _jsonio.write_atomic(get_config_path(), _jsonio.dumps(config, indent=True))
+    _config_cache = None
 
 
 def init_config() -> bool:
@@ -75,14 +89,13 @@ def init_config() -> bool:
 
 def get_config_value(config: Dict[str, Any], key: str) -> Optional[Any]:
     """Get a config value using dot notation (e.g., 'stack.frontend')"""
-    keys = key.split('.')
     value = config
 
-    for k in keys:
-        if isinstance(value, dict) and k in value:
+    try:
+        for k in key.split('.'):
             value = value[k]
-        else:
-            return None
+    except (KeyError, TypeError):
+        return None  # Missing key, or a non-dict value along the path
 
     return value
 
@@ -94,9 +107,7 @@ def set_config_value(config: Dict[str, Any], key: str, value: str) -> Dict[str,
 
     # Navigate to the parent of the target key
     for k in keys[:-1]:
-        if k not in current:
-            current[k] = {}
-        current = current[k]
+        current = current.setdefault(k, {})
 
     # Set the value
     current[keys[-1]] = value
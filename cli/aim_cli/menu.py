@@ -8,24 +8,121 @@ Licensed under MIT License
 """
 
 import sys
+import time
 from pathlib import Path
-from typing import Optional, Dict, List, Callable
+from types import SimpleNamespace
+from typing import Optional, Dict, List, Callable, Tuple
 
 from aim_cli import __version__
 from aim_cli.cli import (
     Colors, print_success, print_error, print_info, print_warning,
     cmd_init, cmd_fetch, cmd_list, cmd_validate, cmd_info,
-    fetch_registry, find_package, AIM_DIR, LOCK_FILE
+    fetch_registry, list_intents, AIM_DIR, LOCK_FILE
 )
 from aim_cli.config import (
-    load_config, save_config, get_config_path, DEFAULT_CONFIG
-)
-from aim_cli.prompt_builder import (
-    build_synthesis_prompt, interactive_prompt_builder,
-    copy_to_clipboard
+    load_config_cached, save_config, get_config_path, DEFAULT_CONFIG
 )
 
 
+# Static main menu entries, joined once
+_MAIN_MENU_BODY = "\n".join([
+    " 1. Initialize new project",
+    " 2. Fetch package from registry",
+    " 3. List installed packages",
+    " 4. Generate synthesis prompt",
+    " 5. Configure tech stack (wizard)",
+    " 6. View/edit configuration",
+    " 7. Validate intent files",
+    " 8. Package information",
+    " 9. Help",
+    " 0. Exit",
+])
+
+# Help screen body, printed in one write
+_HELP_TEXT = f"""{Colors.BOLD}Sinth — the CLI for AIM{Colors.END}
+
+Sinth helps you fetch, manage, and synthesize intent-based packages.
+
+{Colors.BOLD}Getting Started:{Colors.END}
+
+  1. Initialize a project:     sinth init
+  2. Fetch a package:          sinth fetch weather
+  3. Generate synthesis:       sinth synth weather
+
+{Colors.BOLD}Common Commands:{Colors.END}
+
+  sinth                        Interactive menu (this menu)
+  sinth init                   Initialize new project
+  sinth fetch <package>        Fetch package from registry
+  sinth list                   List installed packages
+  sinth synth <package>        Generate synthesis prompt
+  sinth synth --interactive    Interactive prompt builder
+  sinth validate               Validate intent files
+  sinth info <package>         Show package information
+  sinth config init            Create configuration file
+  sinth config list            Show configuration
+
+{Colors.BOLD}Configuration:{Colors.END}
+
+  Configuration is stored in aim.config.json
+  Use the wizard (option 5) for guided setup
+  Or use: sinth config set stack.frontend React
+
+{Colors.BOLD}Need More Help?{Colors.END}
+
+  Documentation: https://intentmodel.dev
+  Registry:      https://intentmodel.dev/registry-files/index.json
+"""
+
+# Shared args for commands that take no options
+_EMPTY_ARGS = SimpleNamespace()
+
+# How long a registry fetched in this menu session is reused, in seconds
+REGISTRY_CACHE_TTL = 60
+
+# (monotonic fetch time, registry, name index, rendered package lists by
+# with_descriptions) from the last fetch in this session
+_registry_cache: Optional[Tuple[float, Dict, Dict[str, Dict], Dict[bool, str]]] = None
+
+
+def get_registry(ttl: float = REGISTRY_CACHE_TTL) -> Tuple[Dict, Dict[str, Dict]]:
+    """Fetch the registry and its name index, reusing the copy fetched within the last `ttl` seconds"""
+    global _registry_cache
+    if _registry_cache is not None and time.monotonic() - _registry_cache[0] < ttl:
+        return _registry_cache[1], _registry_cache[2]
+
+    print_info("Fetching registry...")
+    registry, index = fetch_registry()
+    _registry_cache = (time.monotonic(), registry, index, {})
+    return registry, index
+
+
+def clear_registry_cache() -> None:
+    """Forget the session registry so the next get_registry() refetches it"""
+    global _registry_cache
+    _registry_cache = None
+
+
+def package_listing(with_descriptions: bool) -> str:
+    """Numbered list of the session registry's packages, built once per fetch
+
+    Call after get_registry().
+    """
+    _fetched, registry, _index, listings = _registry_cache
+    listing = listings.get(with_descriptions)
+    if listing is None:
+        arrow = f"     {Colors.CYAN}→{Colors.END} "
+        lines = []
+        for i, pkg in enumerate(registry.get('packages', []), 1):
+            lines.append(f"  {i}. {pkg.get('name', 'unknown')} (v{pkg.get('version', 'unknown')})")
+            if with_descriptions:
+                description = pkg.get('description')
+                if description:
+                    lines.append(arrow + description)
+        listing = listings[with_descriptions] = "\n".join(lines)
+    return listing
+
+
 def print_header(title: str) -> None:
     """Print a styled menu header"""
     border = "─" * (len(title) + 4)
@@ -36,41 +133,29 @@ def print_header(title: str) -> None:
 
 def get_menu_choice(prompt: str, valid_range: range) -> Optional[int]:
     """Get validated numeric input from user with Ctrl+C handling"""
-    try:
-        choice = input(prompt).strip()
-        if not choice:
+    out_of_range = f"Please enter a number between {valid_range.start} and {valid_range.stop - 1}"
+    while True:
+        try:
+            choice = input(prompt).strip()
+            if not choice:
+                return None
+
+            num = int(choice)
+            if num in valid_range:
+                return num
+            print_warning(out_of_range)
+        except ValueError:
+            print_warning("Please enter a valid number")
+        except (KeyboardInterrupt, EOFError):
+            print("\n")
             return None
 
-        num = int(choice)
-        if num in valid_range:
-            return num
-        else:
-            print_warning(f"Please enter a number between {valid_range.start} and {valid_range.stop - 1}")
-            return get_menu_choice(prompt, valid_range)
-    except ValueError:
-        print_warning("Please enter a valid number")
-        return get_menu_choice(prompt, valid_range)
-    except (KeyboardInterrupt, EOFError):
-        print("\n")
-        return None
-
 
 def show_main_menu() -> Optional[int]:
     """Display main menu and get user choice"""
     print_header("Sinth — Synthesize intent into reality")
 
-    print(f"{Colors.CYAN}v{__version__}{Colors.END}\n")
-    print("What would you like to do?\n")
-    print(" 1. Initialize new project")
-    print(" 2. Fetch package from registry")
-    print(" 3. List installed packages")
-    print(" 4. Generate synthesis prompt")
-    print(" 5. Configure tech stack (wizard)")
-    print(" 6. View/edit configuration")
-    print(" 7. Validate intent files")
-    print(" 8. Package information")
-    print(" 9. Help")
-    print(" 0. Exit\n")
+    print(f"{Colors.CYAN}v{__version__}{Colors.END}\n\nWhat would you like to do?\n\n{_MAIN_MENU_BODY}\n")
 
     return get_menu_choice("Choice [0-9]: ", range(0, 10))
 
@@ -89,9 +174,7 @@ def menu_init() -> None:
     confirm = input("Continue? (y/n) [y]: ").strip().lower()
 
     if confirm in ('', 'y', 'yes'):
-        class Args:
-            pass
-        cmd_init(Args())
+        cmd_init(_EMPTY_ARGS)
         input("\nPress Enter to continue...")
     else:
         print_info("Cancelled")
@@ -99,54 +182,50 @@ def menu_init() -> None:
 
 def menu_fetch() -> None:
     """Fetch package with interactive selection"""
-    print_header("Fetch Package from Registry")
+    while True:
+        print_header("Fetch Package from Registry")
 
-    # Ensure aim/ directory exists
-    if not AIM_DIR.exists():
-        print_info(f"Creating {AIM_DIR}/ directory")
-        AIM_DIR.mkdir(parents=True, exist_ok=True)
+        # Ensure aim/ directory exists
+        if not AIM_DIR.exists():
+            print_info(f"Creating {AIM_DIR}/ directory")
+            AIM_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Fetch registry
-    print_info("Fetching registry...")
-    try:
-        registry = fetch_registry()
-    except Exception as e:
-        print_error(f"Failed to fetch registry: {e}")
-        input("\nPress Enter to continue...")
-        return
+        # Fetch registry (reused from earlier in this session when fresh)
+        try:
+            registry, index = get_registry()
+        except Exception as e:
+            print_error(f"Failed to fetch registry: {e}")
+            input("\nPress Enter to continue...")
+            return
 
-    packages = registry.get('packages', [])
-    if not packages:
-        print_warning("No packages found in registry")
-        input("\nPress Enter to continue...")
-        return
+        packages = registry.get('packages', [])
+        if not packages:
+            print_warning("No packages found in registry")
+            input("\nPress Enter to continue...")
+            return
 
-    # Display package list
-    print("\nAvailable packages:\n")
-    for i, pkg in enumerate(packages, 1):
-        name = pkg.get('name', 'unknown')
-        version = pkg.get('version', 'unknown')
-        description = pkg.get('description', '')
-        print(f"  {i}. {name} (v{version})")
-        if description:
-            print(f"     {Colors.CYAN}→{Colors.END} {description}")
-    print(f"  0. Back to main menu\n")
-
-    # Get selection
-    choice = get_menu_choice(f"Choose package [0-{len(packages)}]: ",
-                            range(0, len(packages) + 1))
-    if choice == 0 or choice is None:
-        return
+        # Display package list
+        print("\nAvailable packages:\n")
+        print(package_listing(with_descriptions=True))
+        refresh = len(packages) + 1
+        print(f"  {refresh}. Refresh registry")
+        print(f"  0. Back to main menu\n")
+
+        # Get selection
+        choice = get_menu_choice(f"Choose package [0-{refresh}]: ",
+                                range(0, refresh + 1))
+        if choice == 0 or choice is None:
+            return
+        if choice != refresh:
+            break
+        clear_registry_cache()
 
     # Fetch selected package
     selected_pkg = packages[choice - 1]
 
-    class Args:
-        package = selected_pkg.get('name')
-
     print()
     try:
-        cmd_fetch(Args())
+        cmd_fetch(SimpleNamespace(package=selected_pkg.get('name')), index=index)
     except Exception as e:
         print_error(f"Failed to fetch package: {e}")
 
@@ -157,15 +236,17 @@ def menu_list() -> None:
     """List installed packages"""
     print_header("Installed Packages")
 
-    class Args:
-        pass
-
-    cmd_list(Args())
+    cmd_list(_EMPTY_ARGS)
     input("Press Enter to continue...")
 
 
 def menu_synth() -> None:
     """Synthesis prompt generation submenu"""
+    from aim_cli.prompt_builder import (
+        build_synthesis_prompt, interactive_prompt_builder,
+        copy_to_clipboard
+    )
+
     print_header("Generate Synthesis Prompt")
 
     if not AIM_DIR.exists():
@@ -175,19 +256,15 @@ def menu_synth() -> None:
         return
 
     # Get list of packages
-    intent_files = list(AIM_DIR.glob("*.intent"))
+    intent_files = list_intents()
     if not intent_files:
         print_warning("No packages installed")
         print_info("Fetch a package first (option 2)")
         input("\nPress Enter to continue...")
         return
 
-    # Extract package names
-    packages = []
-    for f in intent_files:
-        # Remove .intent extension
-        pkg_name = f.stem
-        packages.append(pkg_name)
+    # Extract package names (file names without the .intent extension)
+    packages = [f.stem for f in intent_files]
 
     print("\n 1. Quick synthesis (use config settings)")
     print(" 2. Interactive prompt builder")
@@ -211,10 +288,10 @@ def menu_synth() -> None:
             return
 
         package_name = packages[pkg_choice - 1]
-        config = load_config()
+        config = load_config_cached()
 
         # Find intent files
-        intent_files_list = list(AIM_DIR.glob(f"*{package_name}*.intent"))
+        intent_files_list = [f for f in intent_files if package_name in f.stem]
 
         # Build and display prompt
         prompt = build_synthesis_prompt(
@@ -240,12 +317,12 @@ def menu_synth() -> None:
 
     elif choice == 2:
         # Interactive builder
-        config = load_config()
+        config = load_config_cached()
         prompt_data = interactive_prompt_builder(packages, config)
 
         if prompt_data:
             # Find intent files
-            intent_files_list = list(AIM_DIR.glob(f"*{prompt_data['package']}*.intent"))
+            intent_files_list = [f for f in intent_files if prompt_data['package'] in f.stem]
 
             # Build prompt
             prompt = build_synthesis_prompt(
@@ -274,116 +351,52 @@ def menu_synth() -> None:
         menu_list()
 
 
-def menu_config_wizard() -> None:
-    """Interactive configuration wizard - step-by-step setup"""
-    print_header("Configuration Wizard")
-
-    config = load_config()
+# Stack steps of the configuration wizard: (config key, title, common options)
+WIZARD_STEPS = [
+    ('frontend', 'Frontend Framework', ['Next.js', 'React', 'Vue.js', 'Svelte', 'Angular']),
+    ('backend', 'Backend Framework', ['Node.js', 'Express', 'FastAPI', 'Django', 'Spring Boot']),
+    ('database', 'Database', ['PostgreSQL', 'MySQL', 'MongoDB', 'SQLite', 'Redis']),
+]
 
-    print("Let's configure your tech stack step by step.\n")
-    print_info("Press Enter to keep current value, or type a new value\n")
 
-    # Step 1: Frontend
-    print(f"{Colors.BOLD}Step 1/5: Frontend Framework{Colors.END}")
-    print(f"Current: {config['stack']['frontend']}\n")
+def _prompt_stack_choice(step: int, title: str, options: List[str], current: str) -> str:
+    """Show one wizard step's options and return the chosen value (current on Enter)"""
+    if step > 1:
+        print()
+    print(f"{Colors.BOLD}Step {step}/5: {title}{Colors.END}")
+    print(f"Current: {current}\n")
     print("Common options:")
-    print("  1. Next.js")
-    print("  2. React")
-    print("  3. Vue.js")
-    print("  4. Svelte")
-    print("  5. Angular")
-    print("  6. Custom (enter manually)\n")
+    for i, option in enumerate(options, 1):
+        print(f"  {i}. {option}")
+    custom = len(options) + 1
+    print(f"  {custom}. Custom (enter manually)\n")
+
+    choice = get_menu_choice(f"Choice [1-{custom}] or Enter to keep current: ",
+                             range(1, custom + 1))
+    if choice is None:
+        return current
+    if choice == custom:
+        try:
+            value = input(f"Enter {title.lower()}: ").strip()
+        except (KeyboardInterrupt, EOFError):
+            print()
+            return current
+        return value or current
+    return options[choice - 1]
 
-    try:
-        choice_input = input("Choice [1-6] or Enter to keep current: ").strip()
-        if not choice_input:
-            frontend = config['stack']['frontend']
-        else:
-            frontend_choice = int(choice_input)
-            if frontend_choice == 1:
-                frontend = "Next.js"
-            elif frontend_choice == 2:
-                frontend = "React"
-            elif frontend_choice == 3:
-                frontend = "Vue.js"
-            elif frontend_choice == 4:
-                frontend = "Svelte"
-            elif frontend_choice == 5:
-                frontend = "Angular"
-            elif frontend_choice == 6:
-                frontend = input("Enter frontend framework: ").strip()
-            else:
-                frontend = config['stack']['frontend']
-    except (ValueError, KeyboardInterrupt):
-        frontend = config['stack']['frontend']
 
-    # Step 2: Backend
-    print(f"\n{Colors.BOLD}Step 2/5: Backend Framework{Colors.END}")
-    print(f"Current: {config['stack']['backend']}\n")
-    print("Common options:")
-    print("  1. Node.js")
-    print("  2. Express")
-    print("  3. FastAPI")
-    print("  4. Django")
-    print("  5. Spring Boot")
-    print("  6. Custom (enter manually)\n")
+def menu_config_wizard() -> None:
+    """Interactive configuration wizard - step-by-step setup"""
+    print_header("Configuration Wizard")
 
-    try:
-        choice_input = input("Choice [1-6] or Enter to keep current: ").strip()
-        if not choice_input:
-            backend = config['stack']['backend']
-        else:
-            backend_choice = int(choice_input)
-            if backend_choice == 1:
-                backend = "Node.js"
-            elif backend_choice == 2:
-                backend = "Express"
-            elif backend_choice == 3:
-                backend = "FastAPI"
-            elif backend_choice == 4:
-                backend = "Django"
-            elif backend_choice == 5:
-                backend = "Spring Boot"
-            elif backend_choice == 6:
-                backend = input("Enter backend framework: ").strip()
-            else:
-                backend = config['stack']['backend']
-    except (ValueError, KeyboardInterrupt):
-        backend = config['stack']['backend']
+    config = load_config_cached()
 
-    # Step 3: Database
-    print(f"\n{Colors.BOLD}Step 3/5: Database{Colors.END}")
-    print(f"Current: {config['stack']['database']}\n")
-    print("Common options:")
-    print("  1. PostgreSQL")
-    print("  2. MySQL")
-    print("  3. MongoDB")
-    print("  4. SQLite")
-    print("  5. Redis")
-    print("  6. Custom (enter manually)\n")
+    print("Let's configure your tech stack step by step.\n")
+    print_info("Press Enter to keep current value, or type a new value\n")
 
-    try:
-        choice_input = input("Choice [1-6] or Enter to keep current: ").strip()
-        if not choice_input:
-            database = config['stack']['database']
-        else:
-            database_choice = int(choice_input)
-            if database_choice == 1:
-                database = "PostgreSQL"
-            elif database_choice == 2:
-                database = "MySQL"
-            elif database_choice == 3:
-                database = "MongoDB"
-            elif database_choice == 4:
-                database = "SQLite"
-            elif database_choice == 5:
-                database = "Redis"
-            elif database_choice == 6:
-                database = input("Enter database: ").strip()
-            else:
-                database = config['stack']['database']
-    except (ValueError, KeyboardInterrupt):
-        database = config['stack']['database']
+    stack = {}
+    for step, (key, title, options) in enumerate(WIZARD_STEPS, 1):
+        stack[key] = _prompt_stack_choice(step, title, options, config['stack'][key])
 
     # Step 4: Registry URL (advanced)
     print(f"\n{Colors.BOLD}Step 4/5: Registry URL{Colors.END}")
@@ -401,9 +414,9 @@ def menu_config_wizard() -> None:
 
     # Review configuration
     print(f"\n{Colors.BOLD}Review Configuration{Colors.END}\n")
-    print(f"  Frontend:  {frontend}")
-    print(f"  Backend:   {backend}")
-    print(f"  Database:  {database}")
+    print(f"  Frontend:  {stack['frontend']}")
+    print(f"  Backend:   {stack['backend']}")
+    print(f"  Database:  {stack['database']}")
     print(f"  Registry:  {registry}")
     print(f"  Output:    {output_dir}\n")
 
@@ -412,11 +425,7 @@ def menu_config_wizard() -> None:
     if confirm in ('', 'y', 'yes'):
         new_config = {
             "version": "1.0",
-            "stack": {
-                "frontend": frontend,
-                "backend": backend,
-                "database": database
-            },
+            "stack": stack,
             "registry": registry,
             "outputDir": output_dir
         }
@@ -445,7 +454,7 @@ def menu_config_view() -> None:
         return
 
     try:
-        config = load_config()
+        config = load_config_cached()
     except Exception as e:
         print_error(f"Failed to load configuration: {e}")
         input("\nPress Enter to continue...")
@@ -484,55 +493,51 @@ def menu_validate() -> None:
     """Validate intent files"""
     print_header("Validate Intent Files")
 
-    class Args:
-        pass
-
-    cmd_validate(Args())
+    cmd_validate(_EMPTY_ARGS)
     input("\nPress Enter to continue...")
 
 
 def menu_info() -> None:
     """Show package information with interactive selection"""
-    print_header("Package Information")
+    while True:
+        print_header("Package Information")
 
-    # Fetch registry
-    print_info("Fetching registry...")
-    try:
-        registry = fetch_registry()
-    except Exception as e:
-        print_error(f"Failed to fetch registry: {e}")
-        input("\nPress Enter to continue...")
-        return
+        # Fetch registry (reused from earlier in this session when fresh)
+        try:
+            registry, index = get_registry()
+        except Exception as e:
+            print_error(f"Failed to fetch registry: {e}")
+            input("\nPress Enter to continue...")
+            return
 
-    packages = registry.get('packages', [])
-    if not packages:
-        print_warning("No packages found in registry")
-        input("\nPress Enter to continue...")
-        return
+        packages = registry.get('packages', [])
+        if not packages:
+            print_warning("No packages found in registry")
+            input("\nPress Enter to continue...")
+            return
 
-    # Display package list
-    print("\nAvailable packages:\n")
-    for i, pkg in enumerate(packages, 1):
-        name = pkg.get('name', 'unknown')
-        version = pkg.get('version', 'unknown')
-        print(f"  {i}. {name} (v{version})")
-    print(f"  0. Back to main menu\n")
-
-    # Get selection
-    choice = get_menu_choice(f"Choose package [0-{len(packages)}]: ",
-                            range(0, len(packages) + 1))
-    if choice == 0 or choice is None:
-        return
+        # Display package list
+        print("\nAvailable packages:\n")
+        print(package_listing(with_descriptions=False))
+        refresh = len(packages) + 1
+        print(f"  {refresh}. Refresh registry")
+        print(f"  0. Back to main menu\n")
+
+        # Get selection
+        choice = get_menu_choice(f"Choose package [0-{refresh}]: ",
+                                range(0, refresh + 1))
+        if choice == 0 or choice is None:
+            return
+        if choice != refresh:
+            break
+        clear_registry_cache()
 
     # Show selected package info
     selected_pkg = packages[choice - 1]
 
-    class Args:
-        package = selected_pkg.get('name')
-
     print()
     try:
-        cmd_info(Args())
+        cmd_info(SimpleNamespace(package=selected_pkg.get('name')), index=index)
     except Exception as e:
         print_error(f"Failed to get package info: {e}")
 
@@ -543,34 +548,7 @@ def menu_help() -> None:
     """Display help and quick reference"""
     print_header("Help & Quick Reference")
 
-    print(f"{Colors.BOLD}Sinth — the CLI for AIM{Colors.END}\n")
-    print("Sinth helps you fetch, manage, and synthesize intent-based packages.\n")
-
-    print(f"{Colors.BOLD}Getting Started:{Colors.END}\n")
-    print("  1. Initialize a project:     sinth init")
-    print("  2. Fetch a package:          sinth fetch weather")
-    print("  3. Generate synthesis:       sinth synth weather\n")
-
-    print(f"{Colors.BOLD}Common Commands:{Colors.END}\n")
-    print("  sinth                        Interactive menu (this menu)")
-    print("  sinth init                   Initialize new project")
-    print("  sinth fetch <package>        Fetch package from registry")
-    print("  sinth list                   List installed packages")
-    print("  sinth synth <package>        Generate synthesis prompt")
-    print("  sinth synth --interactive    Interactive prompt builder")
-    print("  sinth validate               Validate intent files")
-    print("  sinth info <package>         Show package information")
-    print("  sinth config init            Create configuration file")
-    print("  sinth config list            Show configuration\n")
-
-    print(f"{Colors.BOLD}Configuration:{Colors.END}\n")
-    print("  Configuration is stored in aim.config.json")
-    print("  Use the wizard (option 5) for guided setup")
-    print("  Or use: sinth config set stack.frontend React\n")
-
-    print(f"{Colors.BOLD}Need More Help?{Colors.END}\n")
-    print("  Documentation: https://intentmodel.dev")
-    print("  Registry:      https://intentmodel.dev/registry-files/index.json\n")
+    print(_HELP_TEXT)
 
     input("Press Enter to continue...")
 
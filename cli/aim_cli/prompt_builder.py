@@ -7,14 +7,26 @@ Copyright (c) 2026 Juice d.o.o (https://juice.com.hr)
 Licensed under MIT License
 """
 
-import subprocess
+import os
+import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 BRAIN_URL = "https://intentmodel.dev/brain.md"
 
+# Tech stack keys in prompt order, with their display labels
+STACK_LABELS = (('frontend', 'Frontend'), ('backend', 'Backend'), ('database', 'Database'))
+
+# Clipboard commands per platform, in order of preference
+CLIPBOARD_COMMANDS = {
+    'darwin': (('pbcopy',),),
+    'linux': (('wl-copy',), ('xclip', '-selection', 'clipboard'), ('xsel', '--clipboard', '--input')),
+    'win32': (('clip',),),
+}
+
 
 def build_synthesis_prompt(
     package_name: str,
@@ -24,27 +36,21 @@ def build_synthesis_prompt(
 ) -> str:
     """Build a formatted synthesis prompt for AI assistants"""
 
-    # Build file list - use relative paths or just filenames
-    file_paths = []
-    for f in intent_files:
-        try:
-            # Try to get relative path from cwd
-            rel_path = f.relative_to(Path.cwd())
-            file_paths.append(f"  - {rel_path}")
-        except ValueError:
-            # If that fails, just use the filename with aim/ prefix
-            file_paths.append(f"  - aim/{f.name}")
+    # Build file list - paths under cwd are shown relative to it, others as aim/<name>
+    cwd_prefix = os.path.join(os.getcwd(), '')
+    file_paths = [
+        f"  - {str(f)[len(cwd_prefix):]}" if str(f).startswith(cwd_prefix) else f"  - aim/{f.name}"
+        for f in intent_files
+    ]
 
     file_list = "\n".join(file_paths)
 
     # Build tech stack section
-    stack_items = []
-    if tech_stack.get('frontend'):
-        stack_items.append(f"  - Frontend: {tech_stack['frontend']}")
-    if tech_stack.get('backend'):
-        stack_items.append(f"  - Backend: {tech_stack['backend']}")
-    if tech_stack.get('database'):
-        stack_items.append(f"  - Database: {tech_stack['database']}")
+    stack_items = [
+        f"  - {label}: {tech_stack[key]}"
+        for key, label in STACK_LABELS
+        if tech_stack.get(key)
+    ]
 
     stack_section = "\n".join(stack_items)
 
@@ -136,34 +142,93 @@ def interactive_prompt_builder(packages: List[str], current_config: Dict) -> Dic
     }
 
 
+@lru_cache(maxsize=1)
+def find_clipboard_command() -> Optional[Tuple[str, ...]]:
+    """Find the first installed clipboard command for this platform (looked up once)"""
+    platform = 'linux' if sys.platform.startswith('linux') else sys.platform
+    for command in CLIPBOARD_COMMANDS.get(platform, ()):
+        if command[0] == 'wl-copy' and not os.environ.get('WAYLAND_DISPLAY'):
+            continue  # wl-copy only works inside a Wayland session
+        path = shutil.which(command[0])
+        if path:
+            return (path,) + command[1:]
+    return None
+
+
+def _copy_to_windows_clipboard(text: str) -> bool:
+    """Put text on the Windows clipboard in-process via the Win32 API"""
+    import ctypes
+    from ctypes import wintypes
+
+    CF_UNICODETEXT = 13
+    GMEM_MOVEABLE = 0x0002
+
+    user32 = ctypes.WinDLL('user32', use_last_error=True)
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    user32.OpenClipboard.argtypes = [wintypes.HWND]
+    user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+
+    data = text.encode('utf-16-le') + b'\x00\x00'
+    if not user32.OpenClipboard(None):
+        return False
+    try:
+        user32.EmptyClipboard()
+        handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, len(data))
+        if not handle:
+            return False
+        pointer = kernel32.GlobalLock(handle)
+        if not pointer:
+            kernel32.GlobalFree(handle)
+            return False
+        ctypes.memmove(pointer, data, len(data))
+        kernel32.GlobalUnlock(handle)
+        if not user32.SetClipboardData(CF_UNICODETEXT, handle):
+            kernel32.GlobalFree(handle)
+            return False
+        return True  # The clipboard owns the memory now
+    finally:
+        user32.CloseClipboard()
+
+
 def copy_to_clipboard(text: str) -> bool:
     """Copy text to clipboard - works on macOS, Linux, Windows"""
-    try:
-        if sys.platform == 'darwin':  # macOS
-            proc = subprocess.Popen(['pbcopy'], stdin=subprocess.PIPE)
-            proc.communicate(text.encode('utf-8'))
-            return proc.returncode == 0
-        elif sys.platform.startswith('linux'):  # Linux
-            proc = subprocess.Popen(['xclip', '-selection', 'clipboard'],
-                                  stdin=subprocess.PIPE)
-            proc.communicate(text.encode('utf-8'))
-            return proc.returncode == 0
-        elif sys.platform == 'win32':  # Windows
-            proc = subprocess.Popen(['clip'], stdin=subprocess.PIPE, shell=True)
-            proc.communicate(text.encode('utf-8'))
-            return proc.returncode == 0
-    except FileNotFoundError:
+    if sys.platform == 'win32':
+        try:
+            if _copy_to_windows_clipboard(text):
+                return True
+        except Exception:
+            pass  # Fall back to clip.exe
+
+    command = find_clipboard_command()
+    if command is None:
         return False  # Clipboard utility not available
+
+    import subprocess
+
+    try:
+        # close_fds=False lets CPython spawn via posix_spawn instead of fork+exec
+        return subprocess.run(command, input=text.encode('utf-8'), close_fds=False).returncode == 0
     except Exception:
         return False
 
-    return False
-
 
 def parse_stack_string(stack_str: str) -> Dict[str, str]:
     """Parse a comma-separated stack string like 'React,Node.js,PostgreSQL'"""
-    parts = [p.strip() for p in stack_str.split(',')]
+    parts = stack_str.split(',', 3)  # Anything past the third field is ignored
+
+    if len(parts) == 3:
+        # Common case: exactly frontend, backend, database
+        frontend, backend, database = parts
+        return {'frontend': frontend.strip(), 'backend': backend.strip(), 'database': database.strip()}
 
+    parts = [p.strip() for p in parts]
     stack = {}
     if len(parts) >= 1:
         stack['frontend'] = parts[0]
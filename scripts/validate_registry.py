@@ -1,49 +1,117 @@
 #!/usr/bin/env python3
+import argparse
 import json
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 
 ROOT = Path(__file__).resolve().parents[1]
 REGISTRY_PACKAGES = ROOT / "registry" / "packages"
 REGISTRY_INDEX = ROOT / "registry" / "index.json"
+HEADER_CACHE_FILE = ROOT / ".registry_cache.json"
+FACET_NAMES = ("intent", "schema", "flow", "contract", "persona", "view", "event", "mapping")
+FACETS = frozenset(FACET_NAMES)
+INCLUDABLE_FACETS = tuple(f for f in FACET_NAMES if f not in ("intent", "mapping"))
+# Header and legacy-token patterns match raw bytes; decoding only checks the encoding
 HEADER_RE = re.compile(
-    r"^AIM:\s+([a-z0-9]+(?:\.[a-z0-9]+)*)#(intent|schema|flow|contract|persona|view|event|mapping)@([0-9]+\.[0-9]+)$"
+    rb"^AIM:\s+([a-z0-9]+(?:\.[a-z0-9]+)*)#(" + "|".join(FACET_NAMES).encode("ascii") + rb")@([0-9]+\.[0-9]+)$"
 )
 FEATURE_RE = re.compile(r"^[a-z0-9]+(?:\.[a-z0-9]+)*$")
 VERSION_RE = re.compile(r"^[0-9]+\.[0-9]+$")
 LEGACY_TOKENS = (":::AIL_METADATA", ":::AIM_METADATA", "FEATURE:", "FACET:", "VERSION:")
-INCLUDES_START_RE = re.compile(r"^\s*INCLUDES\s*\{\s*$")
-INCLUDES_ENTRY_RE = re.compile(r'^\s*(schema|flow|contract|persona|view|event)\s*:\s*"([^"]+)"\s*$')
-INCLUDES_END_RE = re.compile(r"^\s*}\s*$")
-FACETS = ("intent", "schema", "flow", "contract", "persona", "view", "event", "mapping")
+LEGACY_RE = re.compile(b"|".join(re.escape(t.encode("ascii")) for t in LEGACY_TOKENS))
+# INCLUDES patterns run over the whole entry file; [^\S\n] is whitespace within a line
+INCLUDES_DECL_RE = re.compile(r"^[^\S\n]*INCLUDES\b.*$", re.MULTILINE)
+INCLUDES_START_RE = re.compile(r"[^\S\n]*INCLUDES[^\S\n]*\{[^\S\n]*")
+INCLUDES_END_RE = re.compile(r"^[^\S\n]*}[^\S\n]*$", re.MULTILINE)
+INCLUDES_LINE_RE = re.compile(r"^[^\S\n]*(\S.*?)[^\S\n]*$", re.MULTILINE)
+INCLUDES_ENTRY_RE = re.compile(rf'({"|".join(INCLUDABLE_FACETS)})\s*:\s*"([^"]+)"')
+# Below this many packages, validating serially beats starting a thread pool
+PARALLEL_MIN_PACKAGES = 4
+
+# With --cache: relative path -> {"mtime_ns", "size", "header"} from the last passing run
+_header_cache: dict[str, dict] | None = None
+_validated_headers: dict[str, dict] = {}
+
+
+class ValidationError(Exception):
+    pass
+
+
+_errors: list[str] = []
 
 
 def fail(msg: str) -> None:
-    print(f"[FAIL] {msg}")
-    sys.exit(1)
+    raise ValidationError(msg)
+
 
+@lru_cache(maxsize=None)
+def read_source(path: Path) -> bytes:
+    return path.read_bytes()
 
+
+@lru_cache(maxsize=None)
 def parse_header(path: Path) -> tuple[str, str, str]:
-    raw = path.read_text(encoding="utf-8")
-    for token in LEGACY_TOKENS:
-        if token in raw:
-            fail(f"{path}: legacy metadata token '{token}' is not allowed")
-    lines = raw.splitlines()
-    first_line = lines[0].strip() if lines else ""
-    m = HEADER_RE.match(first_line)
+    if _header_cache is not None:
+        st = path.stat()
+        key = path.relative_to(ROOT).as_posix()
+        cached = _header_cache.get(key)
+        if cached and cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+            _validated_headers[key] = cached
+            return tuple(cached["header"])
+
+    raw = read_source(path)
+    try:
+        raw.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        fail(f"{path}: not valid UTF-8 ({exc})")
+    end = raw.find(b"\n")
+    if end == -1:
+        end = len(raw)
+    m = HEADER_RE.match(raw[:end].strip())
     if not m:
         fail(f"{path}: first line must match AIM header grammar")
-    return m.group(1), m.group(2), m.group(3)
+    legacy = LEGACY_RE.search(raw, end)
+    if legacy:
+        fail(f"{path}: legacy metadata token '{legacy.group(0).decode('ascii')}' is not allowed")
+    feature, facet, version = (g.decode("ascii") for g in m.groups())
+
+    if _header_cache is not None:
+        _validated_headers[key] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "header": [feature, facet, version],
+        }
+    return feature, facet, version
 
 
-def derive_identity_from_relpath(rel_path: Path) -> tuple[str, str]:
-    if rel_path.suffix != ".intent":
+def load_header_cache() -> dict[str, dict]:
+    try:
+        cache = json.loads(HEADER_CACHE_FILE.read_bytes().decode("utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_header_cache() -> None:
+    tmp = HEADER_CACHE_FILE.with_name(HEADER_CACHE_FILE.name + ".tmp")
+    tmp.write_text(json.dumps(_validated_headers, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, HEADER_CACHE_FILE)
+
+
+def derive_identity_from_relpath(rel_path: str) -> tuple[str, str]:
+    parts = rel_path.split(os.sep)
+    name = parts[-1]
+    if not name.endswith(".intent") or name == ".intent":
         fail(f"{rel_path}: source path must end with .intent")
+    stem = name[:-len(".intent")]
 
-    if len(rel_path.parts) == 1:
-        stem_parts = rel_path.name[:-len(".intent")].split(".")
+    if len(parts) == 1:
+        stem_parts = stem.split(".")
         if stem_parts[-1] in FACETS:
             if len(stem_parts) < 2:
                 fail(f"{rel_path}: flat source filename must be <feature>.<facet>.intent")
@@ -53,8 +121,8 @@ def derive_identity_from_relpath(rel_path: Path) -> tuple[str, str]:
             feature = ".".join(stem_parts)
             facet = "intent"
     else:
-        feature = ".".join(rel_path.parts[:-1])
-        facet = rel_path.stem
+        feature = ".".join(parts[:-1])
+        facet = stem
 
     if not FEATURE_RE.match(feature):
         fail(f"{rel_path}: derived feature '{feature}' is invalid")
@@ -71,7 +139,7 @@ def validate_source_file(
     expected_version: str | None = None,
 ) -> tuple[str, str, str]:
     feature, facet, version = parse_header(path)
-    rel_path = path.relative_to(package_root)
+    rel_path = os.path.relpath(path, package_root)
     path_feature, path_facet = derive_identity_from_relpath(rel_path)
 
     if path_feature != feature:
@@ -99,48 +167,46 @@ def validate_entry_file(path: Path, expected_feature: str, expected_version: str
 
 
 def validate_includes(entry_path: Path, expected_feature: str, expected_version: str) -> None:
-    raw = entry_path.read_text(encoding="utf-8")
-    lines = raw.splitlines()
+    try:
+        raw = read_source(entry_path).decode("utf-8")
+    except UnicodeDecodeError as exc:
+        fail(f"{entry_path}: not valid UTF-8 ({exc})")
     include_entries: list[tuple[str, str]] = []
     include_block_found = False
 
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        if INCLUDES_START_RE.match(line):
-            if include_block_found:
-                fail(f"{entry_path}: multiple INCLUDES blocks are not allowed")
-            include_block_found = True
-            seen_keys = set()
-            i += 1
-
-            while i < len(lines) and not INCLUDES_END_RE.match(lines[i]):
-                current = lines[i]
-                if not current.strip():
-                    i += 1
-                    continue
-                m = INCLUDES_ENTRY_RE.match(current)
-                if not m:
-                    fail(
-                        f"{entry_path}: malformed INCLUDES entry '{current.strip()}' "
-                        "(expected: key: \"path.intent\")"
-                    )
-                include_facet, rel = m.groups()
-                if include_facet in seen_keys:
-                    fail(f"{entry_path}: duplicate INCLUDES key '{include_facet}'")
-                seen_keys.add(include_facet)
-                include_entries.append((include_facet, rel))
-                i += 1
-
-            if i >= len(lines):
-                fail(f"{entry_path}: unterminated INCLUDES block")
-
-        elif re.match(r"^\s*INCLUDES\b", line):
+    pos = 0
+    while True:
+        decl = INCLUDES_DECL_RE.search(raw, pos)
+        if not decl:
+            break
+        if not INCLUDES_START_RE.fullmatch(decl.group(0)):
             fail(f"{entry_path}: malformed INCLUDES declaration (expected: INCLUDES {{)")
+        if include_block_found:
+            fail(f"{entry_path}: multiple INCLUDES blocks are not allowed")
+        include_block_found = True
+
+        end = INCLUDES_END_RE.search(raw, decl.end())
+        body_end = end.start() if end else len(raw)
+        seen_keys = set()
+        for line in INCLUDES_LINE_RE.finditer(raw, decl.end() + 1, body_end):
+            current = line.group(1)
+            m = INCLUDES_ENTRY_RE.fullmatch(current)
+            if not m:
+                fail(
+                    f"{entry_path}: malformed INCLUDES entry '{current}' "
+                    "(expected: key: \"path.intent\")"
+                )
+            include_facet, rel = m.groups()
+            if include_facet in seen_keys:
+                fail(f"{entry_path}: duplicate INCLUDES key '{include_facet}'")
+            seen_keys.add(include_facet)
+            include_entries.append((include_facet, rel))
 
-        i += 1
+        if not end:
+            fail(f"{entry_path}: unterminated INCLUDES block")
+        pos = end.end()
 
+    package_root = REGISTRY_PACKAGES / expected_feature
     for include_facet, rel in include_entries:
         rel_path = Path(rel)
         if rel_path.is_absolute():
@@ -150,21 +216,41 @@ def validate_includes(entry_path: Path, expected_feature: str, expected_version:
         if ".." in rel_path.parts:
             fail(f"{entry_path}: INCLUDES path must not contain parent traversal, got '{rel}'")
         target = entry_path.parent / rel
-        if not target.exists():
+        try:
+            feature, facet, version = validate_source_file(
+                target,
+                package_root=package_root,
+                expected_feature=expected_feature,
+                expected_version=expected_version,
+            )
+        except FileNotFoundError:
             fail(f"{entry_path}: includes missing file '{rel}'")
-        feature, facet, version = validate_source_file(
-            target,
-            package_root=REGISTRY_PACKAGES / expected_feature,
-            expected_feature=expected_feature,
-            expected_version=expected_version,
-        )
         if facet != include_facet:
             fail(f"{entry_path}: include '{rel}' facet '{facet}' does not match key '{include_facet}'")
 
 
+@lru_cache(maxsize=None)
+def list_package_dirs() -> list[Path]:
+    with os.scandir(REGISTRY_PACKAGES) as entries:
+        return sorted(Path(e.path) for e in entries if e.is_dir())
+
+
+def list_intent_files(root: Path) -> list[Path]:
+    found = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for e in entries:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif e.name.endswith(".intent"):
+                    found.append(e.path)
+    return sorted(Path(p) for p in found)
+
+
 def validate_no_stale_manifests() -> None:
     stale = []
-    for pkg_dir in sorted([p for p in REGISTRY_PACKAGES.iterdir() if p.is_dir()]):
+    for pkg_dir in list_package_dirs():
         for name in ("package.json", "manifest.ail", "manifest.intent"):
             if (pkg_dir / name).exists():
                 stale.append(str(pkg_dir / name))
@@ -172,11 +258,78 @@ def validate_no_stale_manifests() -> None:
         fail(f"stale package manifests are not allowed: {', '.join(stale)}")
 
 
+def validate_package_sources(name: str, version: str, entry_path: Path) -> None:
+    validate_entry_file(entry_path, expected_feature=name, expected_version=version)
+    validate_includes(entry_path, expected_feature=name, expected_version=version)
+    pkg_root = REGISTRY_PACKAGES / name
+    intent_entry_files = []
+    seen_identities: dict[tuple[str, str], Path] = {}
+    for source in list_intent_files(pkg_root):
+        source_feature, source_facet, _source_version = validate_source_file(
+            source,
+            package_root=pkg_root,
+            expected_feature=name,
+            expected_version=version,
+        )
+        identity = (source_feature, source_facet)
+        if identity in seen_identities:
+            fail(
+                f"{pkg_root}: duplicate source identity {source_feature}#{source_facet} "
+                f"found in '{seen_identities[identity].relative_to(pkg_root)}' and "
+                f"'{source.relative_to(pkg_root)}'"
+            )
+        seen_identities[identity] = source
+        if source_facet == "intent":
+            intent_entry_files.append(source)
+    if len(intent_entry_files) != 1:
+        fail(f"{pkg_root}: must contain exactly one #intent source file")
+    if os.path.normpath(intent_entry_files[0]) != os.path.normpath(entry_path):
+        fail(
+            f"{REGISTRY_INDEX}: package '{name}' entry must match intent file "
+            f"'{intent_entry_files[0].name}'"
+        )
+
+
+def check_package_sources(job: tuple[str, str, Path]) -> str | None:
+    try:
+        validate_package_sources(*job)
+    except ValidationError as exc:
+        return str(exc)
+    return None
+
+
+def validate_index_entry(idx: int, pkg: object, indexed_names: set[str]) -> tuple[str, str, Path]:
+    if not isinstance(pkg, dict):
+        fail(f"{REGISTRY_INDEX}: package at index {idx} must be an object")
+    for key in ("name", "version", "entry"):
+        if key not in pkg:
+            fail(f"{REGISTRY_INDEX}: package at index {idx} missing '{key}'")
+    name = pkg["name"]
+    version = pkg["version"]
+    entry = pkg["entry"]
+    if not isinstance(name, str) or not FEATURE_RE.match(name):
+        fail(f"{REGISTRY_INDEX}: invalid package name '{name}'")
+    if name in indexed_names:
+        fail(f"{REGISTRY_INDEX}: duplicate package name '{name}'")
+    indexed_names.add(name)
+    if not isinstance(version, str) or not VERSION_RE.match(version):
+        fail(f"{REGISTRY_INDEX}: package '{name}' has invalid version '{version}'")
+    if not isinstance(entry, str) or not entry.endswith(".intent"):
+        fail(f"{REGISTRY_INDEX}: package '{name}' entry must be a .intent path")
+    entry_path = ROOT / entry
+    if not entry_path.exists():
+        fail(f"{REGISTRY_INDEX}: package '{name}' entry does not exist: {entry}")
+    expected_prefix = f"registry/packages/{name}/"
+    if not entry.startswith(expected_prefix):
+        fail(f"{REGISTRY_INDEX}: package '{name}' entry must be under '{expected_prefix}'")
+    return name, version, entry_path
+
+
 def validate_index_and_packages() -> int:
     if not REGISTRY_INDEX.exists():
         fail(f"missing registry index: {REGISTRY_INDEX}")
     try:
-        index = json.loads(REGISTRY_INDEX.read_text(encoding="utf-8"))
+        index = json.loads(REGISTRY_INDEX.read_bytes().decode("utf-8"))
     except Exception as exc:  # noqa: BLE001
         fail(f"{REGISTRY_INDEX}: invalid JSON ({exc})")
 
@@ -189,62 +342,23 @@ def validate_index_and_packages() -> int:
     if not isinstance(index["packages"], list) or not index["packages"]:
         fail(f"{REGISTRY_INDEX}: 'packages' must be a non-empty array")
 
-    package_dirs = sorted([p for p in REGISTRY_PACKAGES.iterdir() if p.is_dir()])
+    package_dirs = list_package_dirs()
     package_names = {p.name for p in package_dirs}
     indexed_names = set()
+    jobs: list[tuple[str, str, Path]] = []
 
     for idx, pkg in enumerate(index["packages"], start=1):
-        if not isinstance(pkg, dict):
-            fail(f"{REGISTRY_INDEX}: package at index {idx} must be an object")
-        for key in ("name", "version", "entry"):
-            if key not in pkg:
-                fail(f"{REGISTRY_INDEX}: package at index {idx} missing '{key}'")
-        name = pkg["name"]
-        version = pkg["version"]
-        entry = pkg["entry"]
-        if not isinstance(name, str) or not FEATURE_RE.match(name):
-            fail(f"{REGISTRY_INDEX}: invalid package name '{name}'")
-        if name in indexed_names:
-            fail(f"{REGISTRY_INDEX}: duplicate package name '{name}'")
-        indexed_names.add(name)
-        if not isinstance(version, str) or not VERSION_RE.match(version):
-            fail(f"{REGISTRY_INDEX}: package '{name}' has invalid version '{version}'")
-        if not isinstance(entry, str) or not entry.endswith(".intent"):
-            fail(f"{REGISTRY_INDEX}: package '{name}' entry must be a .intent path")
-        entry_path = ROOT / entry
-        if not entry_path.exists():
-            fail(f"{REGISTRY_INDEX}: package '{name}' entry does not exist: {entry}")
-        expected_prefix = f"registry/packages/{name}/"
-        if not entry.startswith(expected_prefix):
-            fail(f"{REGISTRY_INDEX}: package '{name}' entry must be under '{expected_prefix}'")
-        validate_entry_file(entry_path, expected_feature=name, expected_version=version)
-        validate_includes(entry_path, expected_feature=name, expected_version=version)
-        intent_entry_files = []
-        seen_identities: dict[tuple[str, str], Path] = {}
-        for source in sorted((REGISTRY_PACKAGES / name).rglob("*.intent")):
-            source_feature, source_facet, _source_version = validate_source_file(
-                source,
-                package_root=REGISTRY_PACKAGES / name,
-                expected_feature=name,
-                expected_version=version,
-            )
-            identity = (source_feature, source_facet)
-            if identity in seen_identities:
-                fail(
-                    f"{REGISTRY_PACKAGES / name}: duplicate source identity {source_feature}#{source_facet} "
-                    f"found in '{seen_identities[identity].relative_to(REGISTRY_PACKAGES / name)}' and "
-                    f"'{source.relative_to(REGISTRY_PACKAGES / name)}'"
-                )
-            seen_identities[identity] = source
-            if source_facet == "intent":
-                intent_entry_files.append(source)
-        if len(intent_entry_files) != 1:
-            fail(f"{REGISTRY_PACKAGES / name}: must contain exactly one #intent source file")
-        if intent_entry_files[0].resolve() != entry_path.resolve():
-            fail(
-                f"{REGISTRY_INDEX}: package '{name}' entry must match intent file "
-                f"'{intent_entry_files[0].name}'"
-            )
+        try:
+            jobs.append(validate_index_entry(idx, pkg, indexed_names))
+        except ValidationError as exc:
+            _errors.append(str(exc))
+
+    if len(jobs) < PARALLEL_MIN_PACKAGES:
+        results = [check_package_sources(job) for job in jobs]
+    else:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+            results = list(ex.map(check_package_sources, jobs))
+    _errors.extend(msg for msg in results if msg)
 
     if indexed_names != package_names:
         missing_in_index = sorted(package_names - indexed_names)
@@ -259,14 +373,38 @@ def validate_index_and_packages() -> int:
 
 
 def main() -> None:
-    if not REGISTRY_PACKAGES.exists():
-        fail(f"missing directory: {REGISTRY_PACKAGES}")
-
-    if not any(p.is_dir() for p in REGISTRY_PACKAGES.iterdir()):
-        fail("registry/packages must contain at least one package directory")
+    global _header_cache
+    parser = argparse.ArgumentParser(description="Validate the AIM package registry.")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"skip re-reading source files unchanged since the last passing run "
+        f"(kept in {HEADER_CACHE_FILE.name})",
+    )
+    args = parser.parse_args()
+    if args.cache:
+        _header_cache = load_header_cache()
 
-    validate_no_stale_manifests()
-    count = validate_index_and_packages()
+    try:
+        if not REGISTRY_PACKAGES.exists():
+            fail(f"missing directory: {REGISTRY_PACKAGES}")
+
+        if not list_package_dirs():
+            fail("registry/packages must contain at least one package directory")
+
+        try:
+            validate_no_stale_manifests()
+        except ValidationError as exc:
+            _errors.append(str(exc))
+        count = validate_index_and_packages()
+    except ValidationError as exc:
+        _errors.append(str(exc))
+    if _errors:
+        for msg in _errors:
+            print(f"[FAIL] {msg}")
+        sys.exit(1)
+    if args.cache:
+        save_header_cache()
     print(f"[OK] Validated {count} package(s)")
 
 